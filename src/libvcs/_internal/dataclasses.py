@@ -6,12 +6,31 @@ This is an internal API not covered by versioning policy.
 """
 
 import dataclasses
+import sys
 import typing as t
 from operator import attrgetter
 
 if t.TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
+DATACLASS_SLOTS: dict[str, t.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+"""Keyword arguments for :func:`~dataclasses.dataclass` to use ``__slots__``.
+
+``slots=True`` requires Python 3.10+, on older versions this is a no-op.
+
+Examples
+--------
+>>> @dataclasses.dataclass(**DATACLASS_SLOTS)
+... class Point:
+...     x: int
+...     y: int = 0
+
+>>> Point(1)
+Point(x=1, y=0)
+"""
+
 
 class SkipDefaultFieldsReprMixin:
     r"""Skip default fields in :func:`~dataclasses.dataclass` object representation.
@@ -76,14 +95,27 @@ class SkipDefaultFieldsReprMixin:
 
     >>> item
     ItemWithMixin(name=Test, unit_price=2.05)
+
+    Fields declared with ``repr=False`` are always omitted:
+
+    >>> @dataclasses.dataclass(repr=False)
+    ... class ItemWithCache(SkipDefaultFieldsReprMixin):
+    ...     name: str
+    ...     cache: dict = dataclasses.field(default_factory=dict, repr=False)
+    ...
+
+    >>> ItemWithCache('Test')
+    ItemWithCache(name=Test)
     """
 
+    __slots__ = ()
+
     def __repr__(self: "DataclassInstance") -> str:
         """Omit default fields in object representation."""
         nodef_f_vals = (
             (f.name, attrgetter(f.name)(self))
             for f in dataclasses.fields(self)
-            if attrgetter(f.name)(self) != f.default
+            if f.repr and attrgetter(f.name)(self) != f.default
         )
 
         nodef_f_repr = ", ".join(f"{name}={value}" for name, value in nodef_f_vals)
@@ -141,6 +141,13 @@ def run(
     args : list or str, or single str, if shell=True
        the command to run
 
+    close_fds : bool
+        close file descriptors other than stdin, stdout and stderr in the child.
+        On POSIX, passing ``False`` with an absolute ``args[0]``, no ``cwd`` and no
+        ``preexec_fn`` lets :class:`subprocess.Popen` use ``posix_spawn()``, which,
+        unlike ``fork()``, doesn't slow down as the parent process grows. Python's
+        own file descriptors are non-inheritable (:pep:`446`) regardless.
+
     shell : bool
         boolean indicating whether we are using advanced shell
         features. Use only when absolutely necessary, since this allows a lot
@@ -2,10 +2,11 @@
 
 import functools
 import getpass
+import itertools
 import pathlib
 import random
 import shutil
-import textwrap
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Optional, Protocol
 
 import pytest
@@ -30,16 +31,30 @@ class MaxUniqueRepoAttemptsExceeded(exc.LibVCSException):
         )
 
 
+# Resolved once at import: $PATH lookups are otherwise repeated per collected path
+_GIT_PATH = shutil.which("git")
+_HG_PATH = shutil.which("hg")
+_HAS_GIT = _GIT_PATH is not None
+_HAS_SVN = shutil.which("svn") is not None
+_HAS_HG = _HG_PATH is not None
+
+# Fixture commands run absolute executables with close_fds=False and no cwd, so
+# subprocess can start them via posix_spawn() instead of fork(), whose cost grows
+# with the size of the pytest process.
+_GIT_BIN = _GIT_PATH or "git"
+_SVNADMIN_BIN = shutil.which("svnadmin") or "svnadmin"
+_HG_BIN = _HG_PATH or "hg"
+
 skip_if_git_missing = pytest.mark.skipif(
-    not shutil.which("git"),
+    not _HAS_GIT,
     reason="git is not available",
 )
 skip_if_svn_missing = pytest.mark.skipif(
-    not shutil.which("svn"),
+    not _HAS_SVN,
     reason="svn is not available",
 )
 skip_if_hg_missing = pytest.mark.skipif(
-    not shutil.which("hg"),
+    not _HAS_HG,
     reason="hg is not available",
 )
 
@@ -64,19 +79,17 @@ class RandomStrSequence:
 
 namer = RandomStrSequence()
 
+_repo_counter = itertools.count()
+
 
 def pytest_ignore_collect(collection_path: pathlib.Path, config: pytest.Config) -> bool:
     """Skip tests if VCS binaries are missing."""
-    if not shutil.which("svn") and any(
-        needle in str(collection_path) for needle in ["svn", "subversion"]
-    ):
+    path = str(collection_path)
+    if not _HAS_SVN and ("svn" in path or "subversion" in path):
         return True
-    if not shutil.which("git") and "git" in str(collection_path):
+    if not _HAS_GIT and "git" in path:
         return True
-    return bool(
-        not shutil.which("hg")
-        and any(needle in str(collection_path) for needle in ["hg", "mercurial"]),
-    )
+    return not _HAS_HG and ("hg" in path or "mercurial" in path)
 
 
 @pytest.fixture(scope="session")
@@ -99,46 +112,61 @@ def user_path(home_path: pathlib.Path, home_user_name: str) -> pathlib.Path:
     return p
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def set_home(
-    monkeypatch: pytest.MonkeyPatch,
     user_path: pathlib.Path,
-) -> None:
-    """Set home directory, pytest fixture."""
-    monkeypatch.setenv("HOME", str(user_path))
+) -> Iterator[None]:
+    """Set home directory for the test session, pytest fixture."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(user_path))
+        yield
 
 
-@pytest.fixture()
+_GITCONFIG_TEMPLATE = (
+    "[user]\n  email = {email}\n  name = {name}\n[color]\n  diff = auto\n"
+)
+
+_HGRC_TEMPLATE = (
+    "[ui]\n"
+    "username = libvcs tests <libvcs@git-pull.com>\n"
+    "merge = internal:merge\n"
+    "\n"
+    "[trusted]\n"
+    "users = {user}\n"
+)
+
+
+@pytest.fixture(scope="session")
 @skip_if_git_missing
 def gitconfig(user_path: pathlib.Path, set_home: pathlib.Path) -> pathlib.Path:
-    """Return git configuration, pytest fixture."""
+    """Return git configuration, pytest fixture.
+
+    Written and verified once per test session.
+    """
     gitconfig = user_path / ".gitconfig"
     user_email = "libvcs@git-pull.com"
     gitconfig.write_text(
-        textwrap.dedent(
-            f"""
-  [user]
-    email = {user_email}
-    name = {getpass.getuser()}
-  [color]
-    diff = auto
-    """,
-        ),
+        _GITCONFIG_TEMPLATE.format(email=user_email, name=getpass.getuser()),
         encoding="utf-8",
     )
 
-    output = run(["git", "config", "--get", "user.email"])
+    # e.g. "file:/tmp/.../.gitconfig\tlibvcs@git-pull.com"
     used_config_file_output = run(
         [
-            "git",
+            _GIT_BIN,
+            "-C",
+            str(user_path),
             "config",
             "--show-origin",
             "--get",
             "user.email",
         ],
+        close_fds=False,
     )
     assert str(gitconfig) in used_config_file_output
-    assert user_email in output, "Should use our fixture config and home directory"
+    assert (
+        user_email in used_config_file_output
+    ), "Should use our fixture config and home directory"
 
     return gitconfig
 
@@ -149,51 +177,28 @@ def hgconfig(user_path: pathlib.Path, set_home: pathlib.Path) -> pathlib.Path:
     """Return Mercurial configuration, pytest fixture."""
     hgrc = user_path / ".hgrc"
     hgrc.write_text(
-        textwrap.dedent(
-            f"""
-        [ui]
-        username = libvcs tests <libvcs@git-pull.com>
-        merge = internal:merge
-
-        [trusted]
-        users = {getpass.getuser()}
-    """,
-        ),
+        _HGRC_TEMPLATE.format(user=getpass.getuser()),
         encoding="utf-8",
     )
     return hgrc
 
 
 @pytest.fixture()
-def projects_path(
-    user_path: pathlib.Path,
-    request: pytest.FixtureRequest,
-) -> pathlib.Path:
-    """User's local checkouts and clones. Emphemeral directory."""
-    path = user_path / "projects"
-    path.mkdir(exist_ok=True)
+def projects_path(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """User's local checkouts and clones. Emphemeral directory.
 
-    def clean() -> None:
-        shutil.rmtree(path)
-
-    request.addfinalizer(clean)
-    return path
+    Cleanup is left to pytest's temporary directory retention policy.
+    """
+    return tmp_path_factory.mktemp("projects")
 
 
 @pytest.fixture()
-def remote_repos_path(
-    user_path: pathlib.Path,
-    request: pytest.FixtureRequest,
-) -> pathlib.Path:
-    """System's remote (file-based) repos to clone andpush to. Emphemeral directory."""
-    path = user_path / "remote_repos"
-    path.mkdir(exist_ok=True)
-
-    def clean() -> None:
-        shutil.rmtree(path)
+def remote_repos_path(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """System's remote (file-based) repos to clone andpush to. Emphemeral directory.
 
-    request.addfinalizer(clean)
-    return path
+    Cleanup is left to pytest's temporary directory retention policy.
+    """
+    return tmp_path_factory.mktemp("remote_repos")
 
 
 def unique_repo_name(remote_repos_path: pathlib.Path, max_retries: int = 15) -> str:
@@ -202,7 +207,7 @@ def unique_repo_name(remote_repos_path: pathlib.Path, max_retries: int = 15) ->
     while True:
         if attempts > max_retries:
             raise MaxUniqueRepoAttemptsExceeded(attempts=attempts)
-        remote_repo_name: str = next(namer)
+        remote_repo_name = f"repo_{next(_repo_counter)}"
         suggestion = remote_repos_path / remote_repo_name
         if suggestion.exists():
             attempts += 1
@@ -247,7 +252,7 @@ def _create_git_remote_repo(
     if init_cmd_args is None:
         init_cmd_args = []
     remote_repo_path = remote_repos_path / remote_repo_name
-    run(["git", "init", remote_repo_name, *init_cmd_args], cwd=remote_repos_path)
+    run([_GIT_BIN, "init", str(remote_repo_path), *init_cmd_args], close_fds=False)
 
     if remote_repo_post_init is not None and callable(remote_repo_post_init):
         remote_repo_post_init(remote_repo_path=remote_repo_path)
@@ -283,23 +288,41 @@ def create_git_remote_repo(
 def git_remote_repo_single_commit_post_init(remote_repo_path: pathlib.Path) -> None:
     """Post-initialization: Create a test git repo with a single commit."""
     testfile_filename = "testfile.test"
-    run(["touch", testfile_filename], cwd=remote_repo_path)
-    run(["git", "add", testfile_filename], cwd=remote_repo_path)
-    run(["git", "commit", "-m", "test file for dummyrepo"], cwd=remote_repo_path)
+    (remote_repo_path / testfile_filename).touch()
+    # Two direct spawns instead of one ``sh -c``: no shell process in between,
+    # and run(..., close_fds=False) lets subprocess use posix_spawn()
+    git = [_GIT_BIN, "-C", str(remote_repo_path)]
+    run([*git, "add", testfile_filename], close_fds=False)
+    run([*git, "commit", "-m", "test file for dummyrepo"], close_fds=False)
 
 
-@pytest.fixture()
-@skip_if_git_missing
-def git_remote_repo(remote_repos_path: pathlib.Path) -> pathlib.Path:
-    """Pre-made git repo w/ 1 commit, used as a file:// remote to clone and push to."""
+@pytest.fixture(scope="session")
+def git_remote_repo_proto(
+    tmp_path_factory: pytest.TempPathFactory,
+    gitconfig: pathlib.Path,
+) -> pathlib.Path:
+    """Git repo w/ 1 commit, created once per session and copied by git_remote_repo."""
+    if not _HAS_GIT:
+        pytest.skip("git is not available")
     return _create_git_remote_repo(
-        remote_repos_path=remote_repos_path,
+        remote_repos_path=tmp_path_factory.mktemp("remote_repos_proto"),
         remote_repo_name="dummyrepo",
         remote_repo_post_init=git_remote_repo_single_commit_post_init,
         init_cmd_args=None,  # Don't do --bare
     )
 
 
+@pytest.fixture()
+def git_remote_repo(
+    remote_repos_path: pathlib.Path,
+    git_remote_repo_proto: pathlib.Path,
+) -> pathlib.Path:
+    """Pre-made git repo w/ 1 commit, used as a file:// remote to clone and push to."""
+    remote_repo_path = remote_repos_path / "dummyrepo"
+    shutil.copytree(git_remote_repo_proto, remote_repo_path)
+    return remote_repo_path
+
+
 def _create_svn_remote_repo(
     remote_repos_path: pathlib.Path,
     remote_repo_name: str,
@@ -311,7 +334,10 @@ def _create_svn_remote_repo(
         init_cmd_args = []
 
     remote_repo_path = remote_repos_path / remote_repo_name
-    run(["svnadmin", "create", str(remote_repo_path), *init_cmd_args])
+    run(
+        [_SVNADMIN_BIN, "create", str(remote_repo_path), *init_cmd_args],
+        close_fds=False,
+    )
 
     assert remote_repo_path.exists()
     assert remote_repo_path.is_dir()
@@ -326,18 +352,12 @@ def svn_remote_repo_single_commit_post_init(remote_repo_path: pathlib.Path) -> N
     """Post-initialization: Create a test SVN repo with a single commit."""
     assert remote_repo_path.exists()
     repo_dumpfile = pathlib.Path(__file__).parent / "data" / "repotest.dump"
-    run(
-        " ".join(
-            [
-                "svnadmin",
-                "load",
-                str(remote_repo_path),
-                "<",
-                str(repo_dumpfile),
-            ],
-        ),
-        shell=True,
-    )
+    with repo_dumpfile.open("rb") as dumpfile:
+        run(
+            [_SVNADMIN_BIN, "load", str(remote_repo_path)],
+            stdin=dumpfile,
+            close_fds=False,
+        )
 
 
 @pytest.fixture()
@@ -387,7 +407,7 @@ def _create_hg_remote_repo(
         init_cmd_args = []
 
     remote_repo_path = remote_repos_path / remote_repo_name
-    run(["hg", "init", remote_repo_name, *init_cmd_args], cwd=remote_repos_path)
+    run([_HG_BIN, "init", str(remote_repo_path), *init_cmd_args], close_fds=False)
 
     if remote_repo_post_init is not None and callable(remote_repo_post_init):
         remote_repo_post_init(remote_repo_path=remote_repo_path)
@@ -398,9 +418,10 @@ def _create_hg_remote_repo(
 def hg_remote_repo_single_commit_post_init(remote_repo_path: pathlib.Path) -> None:
     """Post-initialization: Create a test mercurial repo with a single commit."""
     testfile_filename = "testfile.test"
-    run(["touch", testfile_filename], cwd=remote_repo_path)
-    run(["hg", "add", testfile_filename], cwd=remote_repo_path)
-    run(["hg", "commit", "-m", "test file for hg repo"], cwd=remote_repo_path)
+    (remote_repo_path / testfile_filename).touch()
+    hg = [_HG_BIN, "--cwd", str(remote_repo_path)]
+    run([*hg, "add", testfile_filename], close_fds=False)
+    run([*hg, "commit", "-m", "test file for hg repo"], close_fds=False)
 
 
 @pytest.fixture()
@@ -490,34 +511,47 @@ def add_doctest_fixtures(
     doctest_namespace: dict[str, Any],
     tmp_path: pathlib.Path,
     set_home: pathlib.Path,
-    gitconfig: pathlib.Path,
-    create_git_remote_repo: CreateRepoPytestFixtureFn,
-    create_svn_remote_repo: CreateRepoPytestFixtureFn,
-    create_hg_remote_repo: CreateRepoPytestFixtureFn,
-    git_repo: pathlib.Path,
 ) -> None:
-    """Harness pytest fixtures to pytest's doctest namespace."""
+    """Harness pytest fixtures to pytest's doctest namespace.
+
+    Repositories are only created for the names a doctest refers to, doctests that
+    never touch them don't pay for ``git init`` / ``git clone`` subprocesses.
+    """
     from _pytest.doctest import DoctestItem
 
     if not isinstance(request._pyfuncitem, DoctestItem):  # Only run on doctest items
         return
+    source = "".join(example.source for example in request._pyfuncitem.dtest.examples)
+
+    def uses(*names: str) -> bool:
+        if any(name in source for name in names):
+            return True
+        for name in names:  # Don't leak another doctest's repos
+            doctest_namespace.pop(name, None)
+        return False
+
     doctest_namespace["tmp_path"] = tmp_path
-    if shutil.which("git"):
-        doctest_namespace["gitconfig"] = gitconfig
-        doctest_namespace["create_git_remote_repo"] = functools.partial(
-            create_git_remote_repo,
-            remote_repo_post_init=git_remote_repo_single_commit_post_init,
-            init_cmd_args=None,
-        )
-        doctest_namespace["create_git_remote_repo_bare"] = create_git_remote_repo
-        doctest_namespace["example_git_repo"] = git_repo
-    if shutil.which("svn"):
+    if _HAS_GIT:
+        doctest_namespace["gitconfig"] = request.getfixturevalue("gitconfig")
+        if uses("create_git_remote_repo", "create_git_remote_repo_bare"):
+            create_git_remote_repo = request.getfixturevalue("create_git_remote_repo")
+            doctest_namespace["create_git_remote_repo"] = functools.partial(
+                create_git_remote_repo,
+                remote_repo_post_init=git_remote_repo_single_commit_post_init,
+                init_cmd_args=None,
+            )
+            doctest_namespace["create_git_remote_repo_bare"] = create_git_remote_repo
+        if uses("example_git_repo"):
+            doctest_namespace["example_git_repo"] = request.getfixturevalue("git_repo")
+    if _HAS_SVN and uses("create_svn_remote_repo", "create_svn_remote_repo_bare"):
+        create_svn_remote_repo = request.getfixturevalue("create_svn_remote_repo")
         doctest_namespace["create_svn_remote_repo_bare"] = create_svn_remote_repo
         doctest_namespace["create_svn_remote_repo"] = functools.partial(
             create_svn_remote_repo,
             remote_repo_post_init=svn_remote_repo_single_commit_post_init,
         )
-    if shutil.which("hg"):
+    if _HAS_HG and uses("create_hg_remote_repo", "create_hg_remote_repo_bare"):
+        create_hg_remote_repo = request.getfixturevalue("create_hg_remote_repo")
         doctest_namespace["create_hg_remote_repo_bare"] = create_hg_remote_repo
         doctest_namespace["create_hg_remote_repo"] = functools.partial(
             create_hg_remote_repo,
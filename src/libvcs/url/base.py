@@ -1,14 +1,36 @@
-"""Foundational tools to detect, parse, and validate VCS URLs."""
+"""Foundational tools to detect, parse, and validate VCS URLs.
+
+Matching runs on :mod:`re`, a backtracking engine. The built-in rules are written
+to stay linear on untrusted input (no `ReDoS`_):
+
+- Every pattern is anchored with ``^`` and tried with :meth:`re.Pattern.match`, so
+  a failed attempt isn't retried from every offset of the URL.
+- Repetitions aren't nested, so backtracking is bounded to one pass per run of
+  repeated characters. Matching time measured linear in the URL's length on
+  inputs built to backtrack, e.g. long runs of ``a.`` or ``,``.
+
+Rules registered by users aren't checked for either, keep them to the same shape.
+Atomic groups and possessive quantifiers aren't used, they require Python 3.11.
+
+.. _ReDoS: https://owasp.org/www-community/attacks/Regular_expression_Denial_of_Service_-_ReDoS
+"""
 
 import dataclasses
-from collections.abc import Iterator
+import functools
+import re
+import sys
+import types
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence, ValuesView
 from re import Pattern
-from typing import TYPE_CHECKING, Optional, Protocol
+from typing import Any, Optional, Protocol
 
-from libvcs._internal.dataclasses import SkipDefaultFieldsReprMixin
+from libvcs._internal.dataclasses import DATACLASS_SLOTS, SkipDefaultFieldsReprMixin
 
-if TYPE_CHECKING:
-    from _collections_abc import dict_values
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+else:
+    import sre_parse
 
 
 class URLProtocol(Protocol):
@@ -43,11 +65,354 @@ class Rule(SkipDefaultFieldsReprMixin):
     weight: int = 0
 
 
-@dataclasses.dataclass(repr=False)
-class RuleMap(SkipDefaultFieldsReprMixin):
-    """Pattern matching and parsing capabilities for URL parsers, e.g. GitURL."""
+def _compile_rule_pattern(rule: Rule) -> None:
+    """Compile a rule's pattern in place if it was declared as a string."""
+    if isinstance(rule.pattern, str):
+        rule.pattern = re.compile(rule.pattern)
+
+
+_RE_GROUP_NAME = re.compile(r"(?<!\\)\(\?P(?P<kind>[<=])(?P<name>\w+)")
+"""Named group declaration or backreference inside a pattern's source."""
 
-    _rule_map: dict[str, Rule] = dataclasses.field(default_factory=dict)
+_RE_UNFUSABLE = re.compile(r"\\[1-9]|\(\?\(\d|\(\?[aiLmsux]+\)")
+"""Numbered backreferences and conditionals, and global inline flags, which break
+once combined."""
+
+_INLINE_FLAGS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _fuse_patterns(patterns: tuple[Pattern[str], ...]) -> Optional[Pattern[str]]:
+    """Combine rule patterns into a single alternation, tried in order.
+
+    Each pattern is wrapped in a ``_r<index>`` group, its own group names are
+    prefixed with ``_r<index>_`` (:mod:`re` forbids duplicate names) and its flags
+    are scoped to it.
+
+    Returns ``None`` if the patterns can't be combined safely.
+
+    Results are cached by patterns, so rule maps holding the same rules (e.g. a
+    subclass reusing its parent's rules, or a rule registered then unregistered)
+    share one compiled alternation.
+
+    >>> fused = _fuse_patterns((
+    ...     re.compile(r'^(?P<path>a+)$'),
+    ...     re.compile(r'^(?P<path>b+)$'),
+    ... ))
+
+    >>> fused.match('bbb').lastgroup
+    '_r1'
+
+    >>> fused.match('bbb').group('_r1_path')
+    'bbb'
+    """
+    alternatives = []
+    for index, pattern in enumerate(patterns):
+        if _RE_UNFUSABLE.search(pattern.pattern):
+            return None
+        body = _RE_GROUP_NAME.sub(
+            rf"(?P\g<kind>_r{index}_\g<name>",
+            pattern.pattern,
+        )
+        flags = "".join(char for flag, char in _INLINE_FLAGS if pattern.flags & flag)
+        if flags:
+            # Newline terminates a trailing comment in verbose patterns
+            body = f"(?{flags}:{body}\n)" if "x" in flags else f"(?{flags}:{body})"
+        alternatives.append(f"(?P<_r{index}>{body})")
+
+    try:
+        return re.compile("|".join(alternatives) or "(?!)")
+    except re.error:
+        return None
+
+
+def _sre_items(pattern: Pattern[str]) -> Optional[list[tuple[Any, Any]]]:
+    r"""Return pattern's parsed ``(op, av)`` items, with groups' contents inlined.
+
+    Alternatives of a branch are inlined likewise. Returns ``None`` for patterns
+    matching case-insensitively, whose literals can't be taken as written.
+
+    >>> [op for op, _ in _sre_items(re.compile(r'^(?P<scheme>a)b'))]
+    [AT, LITERAL, LITERAL]
+
+    >>> _sre_items(re.compile(r'^abc', re.IGNORECASE)) is None
+    True
+    """
+    if pattern.flags & re.IGNORECASE:
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    def inline(items: Iterable[tuple[Any, Any]]) -> list[tuple[Any, Any]]:
+        inlined = []
+        for op, av in items:
+            if op is sre_parse.SUBPATTERN and not av[1] & re.IGNORECASE:
+                inlined.extend(inline(av[-1]))  # (group, add_flags, del_flags, items)
+            elif op is sre_parse.BRANCH:
+                inlined.append((op, (av[0], [inline(branch) for branch in av[1]])))
+            else:
+                inlined.append((op, av))
+        return inlined
+
+    return inline(parsed.data)
+
+
+def _required_literal(pattern: Pattern[str]) -> str:
+    r"""Return the longest literal text any match of pattern contains, if any.
+
+    >>> _required_literal(re.compile(r'^(?P<scheme>https?)://(?P<host>[^/]+)'))
+    'http'
+
+    >>> _required_literal(re.compile(r'git\+ssh|git\+file'))
+    'git+'
+
+    >>> _required_literal(re.compile(r'(?:@(?P<rev>.*))?'))
+    ''
+    """
+    items = _sre_items(pattern)
+    if items is None:
+        return ""
+
+    runs = [""]
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            runs[-1] += chr(av)
+        else:
+            runs.append("")
+    return max(runs, key=len)
+
+
+def _required_literals(patterns: Sequence[Pattern[str]]) -> Optional[tuple[str, ...]]:
+    """Return literals, one of which a URL must contain to match any of the patterns.
+
+    Returns ``None`` if a pattern has no literal to go by.
+    """
+    literals = set()
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if not literal:
+            return None
+        literals.add(literal)
+    # A URL containing "git+ssh" contains "git+" too, checking the latter suffices
+    return tuple(
+        sorted(
+            literal
+            for literal in literals
+            if not any(other in literal for other in literals if other != literal)
+        ),
+    )
+
+
+def _first_chars(pattern: Pattern[str]) -> Optional[frozenset[str]]:
+    r"""Return the characters a match of pattern can start with, if known.
+
+    >>> sorted(_first_chars(re.compile(r'^(?P<scheme>git\+ssh|https?)://')))
+    ['g', 'h']
+
+    >>> _first_chars(re.compile(r'^(?P<scheme>ssh)?(?P<user>\w+)@')) is None
+    True
+    """
+    items = _sre_items(pattern)
+    if items is None:
+        return None
+
+    def walk(items: list[tuple[Any, Any]]) -> Optional[frozenset[str]]:
+        for op, av in items:
+            if op is sre_parse.AT and av is sre_parse.AT_BEGINNING:
+                continue
+            if op is sre_parse.LITERAL:
+                return frozenset(chr(av))
+            if op is sre_parse.BRANCH:
+                chars = frozenset[str]()
+                for branch in av[1]:
+                    branch_chars = walk(branch)
+                    if branch_chars is None:
+                        return None
+                    chars |= branch_chars
+                return chars
+            if op is sre_parse.IN and all(
+                in_op is sre_parse.LITERAL for in_op, _ in av
+            ):
+                return frozenset(chr(in_av) for _, in_av in av)
+            return None
+        return None
+
+    return walk(items)
+
+
+_FusedGroups = dict[str, tuple[Rule, tuple[tuple[str, int], ...]]]
+"""Rule and its group names with their offsets into ``match.groups()``, by
+``_r<index>`` group of a combined pattern."""
+
+
+def _fused_groups(fused: Pattern[str], rules: Sequence[Rule]) -> _FusedGroups:
+    """Map the ``_r<index>`` groups of rules' combined pattern back to rules."""
+    group_names: dict[str, list[tuple[str, int]]] = {
+        f"_r{index}": [] for index in range(len(rules))
+    }
+    for fused_name, group in fused.groupindex.items():  # e.g. _r1_path
+        wrapper, _, name = fused_name[1:].partition("_")
+        if name:
+            group_names[f"_{wrapper}"].append((name, group - 1))
+    return {
+        wrapper: (rule, tuple(group_names[wrapper]))
+        for wrapper, rule in zip(group_names, rules)
+    }
+
+
+_FlatRule = tuple[Pattern[str], str, tuple[tuple[str, str], ...]]
+"""A rule's pattern, label and defaults, see :meth:`RuleMap._flat_rules`."""
+
+
+_IS_VALID_RESULTS_MAX = 4096
+"""Number of :meth:`RuleMap.is_valid` results kept per rule map."""
+
+_PARSED_MAX = 2048
+"""Number of parsed URLs kept per parser class, see :attr:`RuleMap._parsed`."""
+
+_EMPTY_RULE_MAP: Mapping[str, Rule] = types.MappingProxyType({})
+"""Shared by rule maps created without rules, until their first register()."""
+
+
+@dataclasses.dataclass(repr=False, **DATACLASS_SLOTS)
+class RuleMap(SkipDefaultFieldsReprMixin):
+    """Pattern matching and parsing capabilities for URL parsers, e.g. GitURL.
+
+    Results are cached: add and remove rules via :meth:`register` and
+    :meth:`unregister`.
+    """
+
+    _rule_map: Mapping[str, Rule] = dataclasses.field(
+        default_factory=lambda: _EMPTY_RULE_MAP,
+    )
+    """Rules by label. Replaced, never mutated, by register() and unregister()."""
+
+    _sorted_rules: Optional[tuple[Rule, ...]] = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Rules by descending weight, see :meth:`by_weight`. Reset on changes."""
+
+    _patterns: dict[Optional[bool], tuple[Pattern[str], ...]] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Compiled patterns of rules by descending weight, keyed by ``is_explicit``. Reset
+    on changes."""
+
+    _fused: dict[Optional[bool], Optional[Pattern[str]]] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Combined pattern of rules, keyed by ``is_explicit``. Reset on changes."""
+
+    _literals: dict[Optional[bool], Optional[tuple[str, ...]]] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Literal text URLs must contain to be valid, keyed by ``is_explicit``, ``None``
+    if unknown. Reset on changes."""
+
+    _buckets: dict[str, Optional[tuple[Pattern[str], _FusedGroups]]] = (
+        dataclasses.field(
+            default_factory=dict,
+            init=False,
+            repr=False,
+            compare=False,
+        )
+    )
+    """Combined pattern of the rules a URL starting with a character can match, and
+    its groups, by character. ``""`` holds the rules for any other character,
+    ``None`` if they can't be combined. Reset on changes."""
+
+    _flat: Optional[tuple[_FlatRule, ...]] = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Rules unpacked for parsing, see :meth:`_flat_rules`. Reset on changes."""
+
+    _epoch: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
+    """Bumped whenever rules change, see :attr:`epoch`."""
+
+    _is_valid_results: dict[tuple[str, Optional[bool]], bool] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """:meth:`is_valid` results, keyed by URL and ``is_explicit``. Emptied once it
+    holds ``_IS_VALID_RESULTS_MAX`` entries. Reset on changes."""
+
+    _parsed: "weakref.WeakKeyDictionary[type, dict[str, dict[str, Any]]]" = (
+        dataclasses.field(
+            default_factory=weakref.WeakKeyDictionary,
+            init=False,
+            repr=False,
+            compare=False,
+        )
+    )
+    """Fields of URLs parsed by parser classes using the rule map, by class and URL,
+    up to ``_PARSED_MAX`` per class. Classes are weakly referenced. Reset on
+    changes."""
+
+    def __post_init__(self) -> None:
+        """Compile string patterns."""
+        for rule in self._rule_map.values():
+            if isinstance(rule, Rule):
+                _compile_rule_pattern(rule)
+
+    def _reset_caches(self) -> None:
+        """Drop combined patterns and results derived from previous rules.
+
+        Fresh containers are assigned rather than cleared in place: copies of the rule
+        map share them until either one changes its rules.
+        """
+        self._epoch += 1
+        self._sorted_rules = None
+        self._flat = None
+        self._patterns = {}
+        self._fused = {}
+        self._literals = {}
+        self._buckets = {}
+        self._is_valid_results = {}
+        self._parsed = weakref.WeakKeyDictionary()
+
+    @property
+    def epoch(self) -> int:
+        """Return a counter of rule changes, for keying results derived from rules.
+
+        >>> from libvcs.url.base import RuleMap
+        >>> rule_map = RuleMap()
+
+        >>> rule_map.epoch
+        0
+
+        >>> rule_map.register(
+        ...     Rule(label='gh', description='', pattern=re.compile('^gh:'))
+        ... )
+
+        >>> rule_map.epoch
+        1
+        """
+        return self._epoch
 
     def register(self, cls: Rule) -> None:
         r"""Add a new URL rule.
@@ -175,6 +540,11 @@ class RuleMap(SkipDefaultFieldsReprMixin):
 
         >>> GitURL.rule_map.register(GitLabPrefix)
 
+        String patterns are compiled once, when the rule is registered:
+
+        >>> GitLabPrefix.pattern
+        re.compile('^gitlab:(?P<path>)')
+
         >>> GitURL.is_valid(url='gitlab:vcs-python/libvcs')
         True
 
@@ -207,19 +577,222 @@ class RuleMap(SkipDefaultFieldsReprMixin):
             rule=pip-url)
         """  # NOQA: E501
         if cls.label not in self._rule_map:
-            self._rule_map[cls.label] = cls
+            _compile_rule_pattern(cls)
+            self._rule_map = {**self._rule_map, cls.label: cls}
+            self._reset_caches()
 
     def unregister(self, label: str) -> None:
         """Remove a URL rule."""
         if label in self._rule_map:
-            del self._rule_map[label]
+            self._rule_map = {
+                rule_label: rule
+                for rule_label, rule in self._rule_map.items()
+                if rule_label != label
+            }
+            self._reset_caches()
+
+    def is_valid(self, url: str, is_explicit: Optional[bool] = None) -> bool:
+        """Return True if any rule matches the start of URL.
+
+        Rules are checked with a single combined pattern where possible.
+
+        >>> from libvcs.url.git import GitURL
+
+        >>> GitURL.rule_map.is_valid('git@github.com:vcs-python/libvcs.git')
+        True
+
+        >>> GitURL.rule_map.is_valid(
+        ...     'git@github.com:vcs-python/libvcs.git', is_explicit=True
+        ... )
+        False
+        """
+        key = (url, is_explicit)
+        results = self._is_valid_results
+        result = results.get(key)
+        if result is None:
+            if len(results) >= _IS_VALID_RESULTS_MAX:
+                results.clear()
+            result = results[key] = self._is_valid(url, is_explicit)
+        return result
+
+    def by_weight(self) -> tuple[Rule, ...]:
+        """Return rules from highest to lowest weight, in order they're tried.
+
+        Rules of equal weight keep their registration order. The result is computed
+        once, and string patterns are compiled along the way.
+
+        >>> from libvcs.url.git import GitURL
+
+        >>> [rule.label for rule in GitURL.rule_map.by_weight()][:2]
+        ['core-git-https', 'core-git-scp']
+        """
+        sorted_rules = self._sorted_rules
+        if sorted_rules is None:
+            epoch = self._epoch
+            sorted_rules = tuple(
+                sorted(
+                    self._rule_map.values(), key=lambda rule: rule.weight, reverse=True
+                )
+            )
+            for rule in sorted_rules:
+                _compile_rule_pattern(rule)
+            if self._epoch == epoch:  # Rules didn't change meanwhile
+                self._sorted_rules = sorted_rules
+        return sorted_rules
+
+    def match(self, url: str) -> Optional[tuple[Rule, dict[str, Optional[str]]]]:
+        """Return the first rule, by weight, matching the start of URL and its groups.
+
+        Rules are tried in a single pass of a combined pattern where possible, leaving
+        out those that can't start with URL's first character.
+
+        >>> from libvcs.url.git import GitURL
+
+        >>> rule, groups = GitURL.rule_map.match('git@github.com:vcs-python/libvcs.git')
+
+        >>> rule.label
+        'core-git-scp'
+
+        >>> groups['hostname'], groups['path']
+        ('github.com', 'vcs-python/libvcs')
+
+        >>> GitURL.rule_map.match('notaurl') is None
+        True
+        """
+        matched = self._match(url)
+        if matched is None:
+            return None
+        rule, names, groups = matched
+        return rule, {name: groups[offset] for name, offset in names}
+
+    def _match(
+        self,
+        url: str,
+    ) -> Optional[tuple[Rule, tuple[tuple[str, int], ...], tuple[Optional[str], ...]]]:
+        """Return the first rule matching URL, like :meth:`match`.
+
+        Rather than a dict, returns the rule's group names with their offsets into the
+        match's groups, and the groups. Parsers skip groups they don't need this way.
+        """
+        buckets = self._get_buckets()
+        bucket = buckets.get(url[:1], buckets[""])
+        if bucket is None:
+            for rule in self.by_weight():
+                match = rule.pattern.match(url)
+                if match is not None:
+                    names = tuple(
+                        (name, index - 1)
+                        for name, index in rule.pattern.groupindex.items()
+                    )
+                    return rule, names, match.groups()
+            return None
+
+        fused, fused_groups = bucket
+        match = fused.match(url)
+        if match is None or match.lastgroup is None:
+            return None
+        rule, names = fused_groups[match.lastgroup]
+        return rule, names, match.groups()
+
+    def _get_buckets(self) -> dict[str, Optional[tuple[Pattern[str], _FusedGroups]]]:
+        """Split rules by the first character of URLs they can match.
+
+        Rules keep their order within each bucket, a URL is only tried against the
+        rules that could match it. Built in full before it's stored, so concurrent
+        callers never see some of the buckets only.
+        """
+        buckets = self._buckets
+        if not buckets:
+            buckets = {}
+            epoch = self._epoch
+            rules = self.by_weight()
+            rule_chars = [_first_chars(rule.pattern) for rule in rules]
+            known_chars = frozenset().union(*filter(None, rule_chars))
+            for char in ["", *sorted(known_chars)]:
+                bucket_rules = tuple(
+                    rule
+                    for rule, chars in zip(rules, rule_chars)
+                    if chars is None or char in chars
+                )
+                fused = _fuse_patterns(tuple(rule.pattern for rule in bucket_rules))
+                buckets[char] = (
+                    None
+                    if fused is None
+                    else (fused, _fused_groups(fused, bucket_rules))
+                )
+            if self._epoch == epoch:
+                self._buckets = buckets
+        return buckets
+
+    def _flat_rules(self) -> tuple[_FlatRule, ...]:
+        """Return pattern, label and defaults of each rule, in registration order.
+
+        For parsers trying every rule, saves looking these up on each rule per URL.
+        Those parsers write matched groups and defaults straight into the instance
+        dict, their fields being plain dataclass fields, skipping ``setattr()``.
+        String patterns are compiled along the way, as in :meth:`by_weight`.
+        """
+        flat = self._flat
+        if flat is None:
+            epoch = self._epoch
+            for rule in self._rule_map.values():
+                _compile_rule_pattern(rule)
+            flat = tuple(
+                (rule.pattern, rule.label, tuple(rule.defaults.items()))
+                for rule in self._rule_map.values()
+            )
+            if self._epoch == epoch:
+                self._flat = flat
+        return flat
+
+    # Caches keyed by is_explicit are looked up once: a concurrent _reset_caches()
+    # swaps in a new dict, results computed meanwhile land in the discarded one.
+
+    def _get_patterns(self, is_explicit: Optional[bool]) -> tuple[Pattern[str], ...]:
+        cache = self._patterns
+        if is_explicit not in cache:
+            cache[is_explicit] = tuple(
+                rule.pattern
+                for rule in self.by_weight()
+                if is_explicit is None or rule.is_explicit == is_explicit
+            )
+        return cache[is_explicit]
+
+    def _get_fused(self, is_explicit: Optional[bool]) -> Optional[Pattern[str]]:
+        cache = self._fused
+        if is_explicit not in cache:
+            cache[is_explicit] = _fuse_patterns(self._get_patterns(is_explicit))
+        return cache[is_explicit]
+
+    def _is_valid(self, url: str, is_explicit: Optional[bool]) -> bool:
+        cache = self._literals
+        if is_explicit not in cache:
+            cache[is_explicit] = _required_literals(self._get_patterns(is_explicit))
+        literals = cache[is_explicit]
+        if literals is not None and not any(literal in url for literal in literals):
+            return False  # Skip the regex for URLs no rule could match
+        fused = self._get_fused(is_explicit=is_explicit)
+        if fused is not None:
+            return fused.match(url) is not None
+        return any(pattern.match(url) for pattern in self._get_patterns(is_explicit))
+
+    def __contains__(self, label: object) -> bool:
+        """Return True if a rule is registered under label.
+
+        >>> from libvcs.url.git import GitURL
+
+        >>> 'core-git-scp' in GitURL.rule_map
+        True
+
+        >>> 'gh-prefix' in GitURL.rule_map
+        False
+        """
+        return label in self._rule_map
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over map of URL rules."""
-        return self._rule_map.__iter__()
+        return iter(self._rule_map)
 
-    def values(
-        self,  # https://github.com/python/typing/discussions/1033
-    ) -> "dict_values[str, Rule]":
+    def values(self) -> ValuesView[Rule]:
         """Return list of URL rules."""
         return self._rule_map.values()
@@ -1,7 +1,7 @@
 """Constants shared across ``libvcs.url``."""
 
 RE_USER = r"""
-    ((?P<user>[^/:@]+)@)?
+    (?:(?P<user>[^/:@]+)@)?
 """
 """Optional user, e.g. 'git@'"""
 
@@ -10,12 +10,12 @@ RE_USER = r"""
 # We modified it to have groupings
 RE_SCP = r"""
     # Server, e.g. 'github.com'.
-    (?P<hostname>([^/:]+))
+    (?P<hostname>[^/:]+)
     (?P<separator>:)
     # The server-side path. e.g. 'user/project.git'. Must start with an
     # alphanumeric character so as not to be confusable with a Windows paths
     # like 'C:/foo/bar' or 'C:\foo\bar'.
-    (?P<path>(\w[^:.]+))
+    (?P<path>\w[^:.]+)
 """
 """Regular expression for scp-style of git URLs."""
 
@@ -23,6 +23,6 @@ RE_SCP = r"""
 # Third-party URLs, e.g. npm, pip, etc.
 #
 RE_PIP_REV = r"""
-    (@(?P<rev>.*))
+    (?:@(?P<rev>.*))
 """
 """Pip-style revision for branch or revision."""
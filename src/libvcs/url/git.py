@@ -18,33 +18,38 @@
 
 import dataclasses
 import re
-from typing import Optional
+import sys
+from collections.abc import Iterable
+from typing import Any, Optional, TypeVar
 
 from libvcs._internal.dataclasses import SkipDefaultFieldsReprMixin
 
-from .base import Rule, RuleMap, URLProtocol
+from .base import _PARSED_MAX, Rule, RuleMap, URLProtocol
 from .constants import RE_PIP_REV, RE_SCP, RE_USER
 
 RE_PATH = r"""
-    (?P<hostname>([^/:@]+))
-    (:(?P<port>\d{1,5}))?
+    (?P<hostname>[^/:@]+)
+    (?::(?P<port>\d{1,5}))?
     (?P<separator>[:,/])?
     (?P<path>
-      (\w[^:.@]*)  # cut the path at . to negate .git, @ from pip
+      \w[^:.@]*  # cut the path at . to negate .git, @ from pip
     )?
 """
 
 RE_SCHEME = r"""
     (?P<scheme>
-      (
-        http|https
-      )
+      http|https
     )
 """
 
 RE_SUFFIX = r"(?P<suffix>\.git)"
 # Some https repos have .git at the end, e.g. https://github.com/org/repo.git
 
+_INTERNED_FIELDS = frozenset(
+    {"scheme", "user", "hostname", "separator", "suffix", "region"},
+)
+"""Fields with few distinct values, interned so URLs parsed in bulk share them."""
+
 
 DEFAULT_RULES: list[Rule] = [
     Rule(
@@ -84,27 +89,145 @@ DEFAULT_RULES: list[Rule] = [
 See also: https://git-scm.com/docs/git-clone#URLS
 """
 
+_CORE_RULES = _CORE_HTTPS_RULE, _CORE_SCP_RULE = tuple(DEFAULT_RULES)
+"""Rules :func:`_fast_match` stands in for."""
+
+
+def _fast_match(
+    rule_map: RuleMap,
+    url: str,
+) -> Optional[tuple[Rule, dict[str, Optional[str]]]]:
+    """Parse the most common URL shapes without regular expressions.
+
+    Handles ``http(s)://host/path[.git]`` and ``user@host:path[.git]``, giving the
+    same result as :meth:`RuleMap.match`. Only applies while the core rules are the
+    first ones tried, returns ``None`` for anything else.
+
+    pip's ``git+http(s)://host/path[.git][@rev]`` is handled too, while ``pip-url``
+    is the first rule tried after them, see :func:`_fast_match_pip`.
+
+    >>> rule, groups = _fast_match(
+    ...     GitBaseURL.rule_map, 'git@github.com:vcs-python/libvcs.git'
+    ... )
+
+    >>> rule.label
+    'core-git-scp'
+
+    >>> groups
+    {'user': 'git', 'hostname': 'github.com', 'separator': ':',
+     'path': 'vcs-python/libvcs', 'suffix': '.git'}
+
+    Ports, among other things, are left to the rules:
+
+    >>> _fast_match(GitBaseURL.rule_map, 'https://github.com:443/vcs-python/libvcs')
+    """
+    rules = rule_map.by_weight()
+    if url.startswith(("git+https://", "git+http://")):
+        # Core rules never match a git+ scheme, pip-url is effectively tried first
+        if rules[:1] == (_PIP_URL_RULE,) or rules[:3] == (*_CORE_RULES, _PIP_URL_RULE):
+            return _fast_match_pip(url)
+        return None
+    if rules[:2] != _CORE_RULES:
+        return None
+
+    suffix = None
+    if url.endswith(".git"):
+        url, suffix = url[:-4], ".git"
+
+    if url.startswith(("https://", "http://")):
+        scheme, _, rest = url.partition("://")
+        hostname, separator, path = rest.partition("/")
+        if not hostname or ":" in hostname or "@" in hostname:
+            return None
+        rule = _CORE_HTTPS_RULE
+        groups: dict[str, Optional[str]] = {"scheme": scheme, "hostname": hostname}
+    elif not url.startswith("ssh"):  # would be taken as the scheme
+        user, _, rest = url.partition("@")
+        hostname, separator, path = rest.partition(":")
+        if not user or not hostname or "/" in user or ":" in user or "/" in hostname:
+            return None
+        rule = _CORE_SCP_RULE
+        groups = {"user": user, "hostname": hostname}
+    else:
+        return None
+
+    # Rules would cut the path short, or there's no path at all
+    if (
+        not separator
+        or len(path) < 2
+        or not (path[0].isascii() and (path[0].isalnum() or path[0] == "_"))
+        or "." in path
+        or ":" in path
+        or "@" in path
+    ):
+        return None
+    groups["separator"] = separator
+    groups["path"] = path
+    groups["suffix"] = suffix
+    return rule, groups
+
+
+def _fast_match_pip(url: str) -> Optional[tuple[Rule, dict[str, Optional[str]]]]:
+    """Parse ``git+http(s)://host/path[.git][@rev]`` like the ``pip-url`` rule.
+
+    Users, ports and anything else the rule would read differently are left to it.
+
+    >>> rule, groups = _fast_match_pip(
+    ...     'git+https://github.com/vcs-python/libvcs.git@v0.10.0'
+    ... )
+
+    >>> rule.label
+    'pip-url'
+
+    >>> groups
+    {'scheme': 'git+https', 'hostname': 'github.com', 'separator': '/',
+     'path': 'vcs-python/libvcs', 'suffix': '.git', 'rev': 'v0.10.0'}
+    """
+    scheme, _, rest = url.partition("://")
+    hostname, separator, rest = rest.partition("/")
+    if not separator or not hostname or ":" in hostname or "@" in hostname:
+        return None
+
+    # The path can't hold "@", so the first one starts the revision
+    path, at, rev = rest.partition("@")
+    suffix = None
+    if path.endswith(".git"):
+        path, suffix = path[:-4], ".git"
+
+    if (
+        not path
+        or not (path[0].isascii() and (path[0].isalnum() or path[0] == "_"))
+        or "." in path
+        or ":" in path
+        or "\n" in rev
+    ):
+        return None
+    return _PIP_URL_RULE, {
+        "scheme": scheme,
+        "hostname": hostname,
+        "separator": separator,
+        "path": path,
+        "suffix": suffix,
+        "rev": rev if at else None,
+    }
+
 
 #
 # Third-party URLs, e.g. npm, pip, etc.
 #
 RE_PIP_SCHEME = r"""
     (?P<scheme>
-      (
-        git\+ssh|
-        git\+https|
-        git\+http|
-        git\+file
-      )
+      git\+ssh|
+      git\+https|
+      git\+http|
+      git\+file
     )
 """
 
 RE_PIP_SCP_SCHEME = r"""
     (?P<scheme>
-      (
-        git\+ssh|
-        git\+file
-      )
+      git\+ssh|
+      git\+file
     )
 """
 
@@ -114,15 +237,15 @@ AWS_CODE_COMMIT_DEFAULT_RULES: list[Rule] = [
         description="AWS CodeCommit HTTPS-style",
         pattern=re.compile(
             rf"""
-        https://git-codecommit\.
-        ((?P<region>[^/]+)\.)
+        ^https://git-codecommit\.
+        (?P<region>[^/]+)\.
         # Server, e.g. 'github.com'.
-        (?P<hostname>([^/:]+))
+        (?P<hostname>[^/:]+)
         (?P<separator>:)?
         # The server-side path. e.g. 'user/project.git'. Must start with an
         # alphanumeric character so as not to be confusable with a Windows paths
         # like 'C:/foo/bar' or 'C:\foo\bar'.
-        (?P<path>(\w[^:.]+))?
+        (?P<path>\w[^:.]+)?
         {RE_PIP_REV}?
         """,
             re.VERBOSE,
@@ -134,15 +257,15 @@ AWS_CODE_COMMIT_DEFAULT_RULES: list[Rule] = [
         description="AWS CodeCommit SSH-style",
         pattern=re.compile(
             rf"""
-        ssh://git-codecommit\.
-        ((?P<region>[^/]+)\.)
+        ^ssh://git-codecommit\.
+        (?P<region>[^/]+)\.
         # Server, e.g. 'github.com'.
-        (?P<hostname>([^/:]+))
+        (?P<hostname>[^/:]+)
         (?P<separator>:)?
         # The server-side path. e.g. 'user/project.git'. Must start with an
         # alphanumeric character so as not to be confusable with a Windows paths
         # like 'C:/foo/bar' or 'C:\foo\bar'.
-        (?P<path>(\w[^:.]+))?
+        (?P<path>\w[^:.]+)?
         {RE_PIP_REV}?
         """,
             re.VERBOSE,
@@ -154,7 +277,7 @@ AWS_CODE_COMMIT_DEFAULT_RULES: list[Rule] = [
         description="AWS CodeCommit git repository",
         pattern=re.compile(
             rf"""
-            codecommit://
+            ^codecommit://
             {RE_PATH}
             {RE_PIP_REV}?
             """,
@@ -167,7 +290,7 @@ AWS_CODE_COMMIT_DEFAULT_RULES: list[Rule] = [
         description="AWS CodeCommit git repository with region",
         pattern=re.compile(
             rf"""
-            codecommit::
+            ^codecommit::
             (?P<region>[^/]+)
             ://
             {RE_PATH}
@@ -201,7 +324,7 @@ PIP_DEFAULT_RULES: list[Rule] = [
         description="pip-style git URL",
         pattern=re.compile(
             rf"""
-        {RE_PIP_SCHEME}
+        ^{RE_PIP_SCHEME}
         ://
         {RE_USER}
         {RE_PATH}
@@ -217,7 +340,7 @@ PIP_DEFAULT_RULES: list[Rule] = [
         description="pip-style git ssh/scp URL",
         pattern=re.compile(
             rf"""
-        {RE_PIP_SCP_SCHEME}
+        ^{RE_PIP_SCP_SCHEME}
         {RE_USER}
         {RE_SCP}?
         {RE_SUFFIX}?
@@ -233,7 +356,7 @@ PIP_DEFAULT_RULES: list[Rule] = [
         description="pip-style git+file:// URL",
         pattern=re.compile(
             rf"""
-        (?P<scheme>git\+file)://
+        ^(?P<scheme>git\+file)://
         (?P<path>[^@]*)
         {RE_PIP_REV}?
         """,
@@ -263,6 +386,9 @@ Notes
 - https://pip.pypa.io/en/stable/topics/vcs-support/
 """
 
+_PIP_URL_RULE = PIP_DEFAULT_RULES[0]
+"""Rule :func:`_fast_match_pip` stands in for."""
+
 NPM_DEFAULT_RULES: list[Rule] = []
 """NPM-style git URLs.
 
@@ -284,6 +410,35 @@ Notes
 """  # NOQA: E501
 
 
+_T = TypeVar("_T", bound="GitBaseURL")
+
+
+def _parse_into(attrs: dict[str, Any], rule_map: RuleMap, url: str) -> None:
+    """Fill an instance dict with the fields parsed from URL."""
+    fast_match = _fast_match(rule_map, url)
+    if fast_match is not None:
+        rule, fields = fast_match
+        attrs["rule"] = rule.label
+        for k, v in fields.items():
+            if v is not None:
+                attrs[k] = sys.intern(v) if k in _INTERNED_FIELDS else v
+    else:
+        matched = rule_map._match(url)
+        if matched is None:
+            return
+        # Only the matched rule's groups, by offset, instead of a dict of all of them
+        rule, names, groups = matched
+        attrs["rule"] = rule.label
+        for k, offset in names:
+            v = groups[offset]
+            if v is not None:
+                attrs[k] = sys.intern(v) if k in _INTERNED_FIELDS else v
+
+    for k, v in rule.defaults.items():
+        if attrs.get(k) is None:
+            attrs[k] = v
+
+
 @dataclasses.dataclass(repr=False)
 class GitBaseURL(
     URLProtocol,
@@ -319,6 +474,8 @@ class GitBaseURL(
 
     - Compatibility checking: :meth:`GitBaseURL.is_valid()`
     - URLs compatible with ``git(1)``: :meth:`GitBaseURL.to_url()`
+    - Parsing in bulk, skipping ``__init__``: :meth:`GitBaseURL.parse_many()`,
+      :meth:`GitBaseURL.parse_cached()`
 
     Attributes
     ----------
@@ -344,29 +501,8 @@ class GitBaseURL(
 
     def __post_init__(self) -> None:
         """Initialize GitURL params into attributes."""
-        url = self.url
-        sorted_maps = dict(
-            sorted(
-                self.rule_map._rule_map.items(),
-                key=lambda item: item[1].weight,
-                reverse=True,
-            ),
-        )
-
-        for rule in sorted_maps.values():
-            match = re.match(rule.pattern, url)
-            if match is None:
-                continue
-            groups = match.groupdict()
-            self.rule = rule.label
-            for k, v in groups.items():
-                if v is not None:
-                    setattr(self, k, v)
-
-            for k in rule.defaults:
-                if getattr(self, k, None) is None:
-                    setattr(self, k, rule.defaults[k])
-            break
+        # Plain dataclass fields: write the instance dict, skipping setattr()
+        _parse_into(self.__dict__, self.rule_map, self.url)
 
     @classmethod
     def is_valid(cls, url: str, is_explicit: Optional[bool] = None) -> bool:
@@ -396,13 +532,69 @@ class GitBaseURL(
         In this case, check :meth:`GitPipURL.is_valid` or :meth:`GitURL.is_valid`'s
         examples.
         """
-        if is_explicit is not None:
-            return any(
-                re.search(rule.pattern, url)
-                for rule in cls.rule_map.values()
-                if rule.is_explicit == is_explicit
-            )
-        return any(re.search(rule.pattern, url) for rule in cls.rule_map.values())
+        return cls.rule_map.is_valid(url=url, is_explicit=is_explicit)
+
+    @classmethod
+    def parse_cached(cls: type[_T], url: str) -> _T:
+        """Return parsed URL, reusing an earlier parse of the same URL if possible.
+
+        Each call returns its own instance, changes to it don't affect the cache.
+
+        >>> git_url = GitBaseURL.parse_cached('git@github.com:vcs-python/libvcs.git')
+
+        >>> git_url == GitBaseURL('git@github.com:vcs-python/libvcs.git')
+        True
+
+        >>> git_url is GitBaseURL.parse_cached('git@github.com:vcs-python/libvcs.git')
+        False
+        """
+        # Kept on the rule map: emptied by rule changes, dropped with a replaced map
+        parsed = cls.rule_map._parsed.setdefault(cls, {})
+        attrs = parsed.get(url)
+        if attrs is None:
+            if len(parsed) >= _PARSED_MAX:
+                parsed.clear()
+            attrs = parsed[url] = cls(url=url).__dict__
+        git_url = object.__new__(cls)
+        git_url.__dict__.update(attrs)
+        return git_url
+
+    @classmethod
+    def parse_many(cls: type[_T], urls: Iterable[str]) -> list[_T]:
+        """Parse URLs in bulk, same as ``[cls(url=url) for url in urls]``.
+
+        Instances are filled in directly rather than going through ``__init__`` for
+        each URL. Subclasses overriding ``__post_init__`` or using default factories
+        are parsed one by one as usual.
+
+        >>> git_urls = GitBaseURL.parse_many([
+        ...     'git@github.com:vcs-python/libvcs.git',
+        ...     'https://github.com/vcs-python/vcspull.git',
+        ... ])
+
+        >>> [git_url.path for git_url in git_urls]
+        ['vcs-python/libvcs', 'vcs-python/vcspull']
+
+        >>> git_urls[0] == GitBaseURL('git@github.com:vcs-python/libvcs.git')
+        True
+        """
+        fields = [field for field in dataclasses.fields(cls) if field.name != "url"]
+        if cls.__post_init__ is not GitBaseURL.__post_init__ or any(
+            field.default is dataclasses.MISSING for field in fields
+        ):
+            return [cls(url=url) for url in urls]
+
+        defaults = {field.name: field.default for field in fields}
+        rule_map = cls.rule_map
+        git_urls = []
+        for url in urls:
+            git_url = object.__new__(cls)
+            attrs = git_url.__dict__
+            attrs["url"] = url
+            attrs.update(defaults)
+            _parse_into(attrs, rule_map, url)
+            git_urls.append(git_url)
+        return git_urls
 
     def to_url(self) -> str:
         """Return a ``git(1)``-compatible URL. Can be used with ``git clone``.
@@ -439,15 +631,13 @@ class GitBaseURL(
         - Formats: Show an example converting a github url from ssh -> https format,
           and the other way around.
         """
-        if self.scheme is not None:
-            parts = [self.scheme, "://", self.hostname, "/", self.path]
-        else:
-            parts = [self.user or "git", "@", self.hostname, ":", self.path]
+        hostname = self.hostname or ""
+        path = self.path or ""
+        suffix = self.suffix or ""
 
-        if self.suffix:
-            parts.append(self.suffix)
-
-        return "".join(part for part in parts if isinstance(part, str))
+        if self.scheme is not None:
+            return f"{self.scheme}://{hostname}/{path}{suffix}"
+        return f"{self.user or 'git'}@{hostname}:{path}{suffix}"
 
 
 @dataclasses.dataclass(repr=False)
@@ -777,7 +967,7 @@ class GitURL(
         ...         ^(?P<scheme>ssh)?
         ...         ((?P<user>\w+)@)?
         ...         (?P<hostname>(github.com)+):
-        ...         (?P<path>(\w[^:]+))
+        ...         (?P<path>\w[^:]+)
         ...         {RE_SUFFIX}?
         ...         ''',
         ...         re.VERBOSE,
@@ -28,20 +28,18 @@ from .base import Rule, RuleMap, URLProtocol
 from .constants import RE_PIP_REV, RE_SCP, RE_USER
 
 RE_PATH = r"""
-    (?P<hostname>([^/:]+))
-    (:(?P<port>\d{1,5}))?
+    (?P<hostname>[^/:]+)
+    (?::(?P<port>\d{1,5}))?
     (?P<separator>[:,/])?
     (?P<path>
-      /?(\w[^:.@]*)
+      /?\w[^:.@]*
     )?
 """
 
 
 RE_SCHEME = r"""
     (?P<scheme>
-      (
-        http|https|ssh
-      )
+      http|https|ssh
     )
 """
 
@@ -85,12 +83,10 @@ DEFAULT_RULES: list[Rule] = [
 #
 RE_PIP_SCHEME = r"""
     (?P<scheme>
-      (
-        hg\+ssh|
-        hg\+https|
-        hg\+http|
-        hg\+file
-      )
+      hg\+ssh|
+      hg\+https|
+      hg\+http|
+      hg\+file
     )
 """
 
@@ -117,7 +113,7 @@ PIP_DEFAULT_RULES: list[Rule] = [
         description="pip-style hg+file:// URL",
         pattern=re.compile(
             r"""
-        (?P<scheme>hg\+file)://
+        ^(?P<scheme>hg\+file)://
         (?P<path>.*)
         """,
             re.VERBOSE,
@@ -215,18 +211,17 @@ class HgBaseURL(
     def __post_init__(self) -> None:
         """Initialize GitURL params into attributes."""
         url = self.url
-        for rule in self.rule_map.values():
-            match = re.match(rule.pattern, url)
+        for pattern, label, defaults in self.rule_map._flat_rules():
+            match = pattern.match(url)
             if match is None:
                 continue
-            groups = match.groupdict()
-            self.rule = rule.label
-            for k, v in groups.items():
-                setattr(self, k, v)
+            attrs = self.__dict__
+            attrs["rule"] = label
+            attrs.update(match.groupdict())
 
-            for k in rule.defaults:
-                if getattr(self, k, None) is None:
-                    setattr(self, k, rule.defaults[k])
+            for k, default in defaults:
+                if attrs.get(k) is None:
+                    attrs[k] = default
 
     @classmethod
     def is_valid(cls, url: str, is_explicit: Optional[bool] = None) -> bool:
@@ -245,13 +240,7 @@ class HgBaseURL(
         >>> HgBaseURL.is_valid(url='notaurl')
         False
         """
-        if is_explicit is not None:
-            return any(
-                re.search(rule.pattern, url)
-                for rule in cls.rule_map.values()
-                if rule.is_explicit == is_explicit
-            )
-        return any(re.search(rule.pattern, url) for rule in cls.rule_map.values())
+        return cls.rule_map.is_valid(url=url, is_explicit=is_explicit)
 
     def to_url(self) -> str:
         """Return a ``hg(1)``-compatible URL. Can be used with ``hg clone``.
@@ -495,7 +484,7 @@ class HgURL(
         ...         ^(?P<scheme>ssh)?
         ...         ((?P<user>\w+)@)?
         ...         (?P<hostname>(hg.mozilla.org)+):
-        ...         (?P<path>(\w[^:]+))
+        ...         (?P<path>\w[^:]+)
         ...         {RE_SUFFIX}?
         ...         ''',
         ...         re.VERBOSE,
@@ -28,11 +28,11 @@ from .base import Rule, RuleMap, URLProtocol
 from .constants import RE_PIP_REV, RE_SCP, RE_USER
 
 RE_PATH = r"""
-    (?P<hostname>([^/:@]+))
-    (:(?P<port>\d{1,5}))?
+    (?P<hostname>[^/:@]+)
+    (?::(?P<port>\d{1,5}))?
     (?P<separator>[:,/])?
     (?P<path>
-      (\w[^:.@]*)
+      \w[^:.@]*
     )?
 """
 
@@ -41,9 +41,7 @@ RE_PATH = r"""
 # https://svnbook.red-bean.com/nightly/en/svn.basic.in-action.html#svn.basic.in-action.wc.tbl-1
 RE_SCHEME = r"""
     (?P<scheme>
-      (
-        file|http|https|svn|svn\+ssh
-      )
+      file|http|https|svn|svn\+ssh
     )
 """
 
@@ -86,11 +84,9 @@ DEFAULT_RULES: list[Rule] = [
 #
 RE_PIP_SCHEME = r"""
     (?P<scheme>
-      (
-        svn\+ssh|
-        svn\+https|
-        svn\+http
-      )
+      svn\+ssh|
+      svn\+https|
+      svn\+http
     )
 """
 
@@ -116,7 +112,7 @@ PIP_DEFAULT_RULES: list[Rule] = [
         description="pip-style svn+file:// URL",
         pattern=re.compile(
             r"""
-        (?P<scheme>svn\+file)://
+        ^(?P<scheme>svn\+file)://
         (?P<path>.*)
         """,
             re.VERBOSE,
@@ -196,18 +192,17 @@ class SvnBaseURL(
     def __post_init__(self) -> None:
         """Initialize SvnURL params into attributes."""
         url = self.url
-        for rule in self.rule_map.values():
-            match = re.match(rule.pattern, url)
+        for pattern, label, defaults in self.rule_map._flat_rules():
+            match = pattern.match(url)
             if match is None:
                 continue
-            groups = match.groupdict()
-            self.rule = rule.label
-            for k, v in groups.items():
-                setattr(self, k, v)
+            attrs = self.__dict__
+            attrs["rule"] = label
+            attrs.update(match.groupdict())
 
-            for k in rule.defaults:
-                if getattr(self, k, None) is None:
-                    setattr(self, k, rule.defaults[k])
+            for k, default in defaults:
+                if attrs.get(k) is None:
+                    attrs[k] = default
 
     @classmethod
     def is_valid(cls, url: str, is_explicit: Optional[bool] = None) -> bool:
@@ -223,13 +218,7 @@ class SvnBaseURL(
         >>> SvnBaseURL.is_valid(url='notaurl')
         False
         """
-        if is_explicit is not None:
-            return any(
-                re.search(rule.pattern, url)
-                for rule in cls.rule_map.values()
-                if rule.is_explicit == is_explicit
-            )
-        return any(re.search(rule.pattern, url) for rule in cls.rule_map.values())
+        return cls.rule_map.is_valid(url=url, is_explicit=is_explicit)
 
     def to_url(self) -> str:
         """Return a ``svn(1)``-compatible URL. Can be used with ``svn checkout``.
@@ -425,7 +414,7 @@ class SvnURL(
         ...         ^(?P<scheme>ssh)?
         ...         ((?P<user>\w+)@)?
         ...         (?P<hostname>(svn.project.org)+):
-        ...         (?P<path>(\w[^:]+))
+        ...         (?P<path>\w[^:]+)
         ...         ''',
         ...         re.VERBOSE,
         ...     ),
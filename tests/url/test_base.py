@@ -0,0 +1,257 @@
+"""Tests for URL rule maps."""
+
+import copy
+import re
+import threading
+import typing as t
+
+import pytest
+
+from libvcs.url import git, hg, svn
+from libvcs.url.base import Rule, RuleMap
+
+
+class RuleMapIsValidFixture(t.NamedTuple):
+    """Test fixture for RuleMap.is_valid()."""
+
+    test_id: str
+    url: str
+    is_explicit: t.Optional[bool]
+    expected: bool
+
+
+RULES = [
+    Rule(
+        label="scp",
+        description="scp-style",
+        pattern=re.compile(r"^(?P<user>\w+)@(?P<hostname>[^:]+):(?P<path>.+)$"),
+    ),
+    Rule(
+        label="prefix",
+        description="Verbose pattern with a trailing comment",
+        pattern=re.compile(
+            r"""
+            ^gh:(?P<path>.+)  # e.g. gh:org/repo
+            """,
+            re.VERBOSE,
+        ),
+        is_explicit=True,
+        weight=10,
+    ),
+    Rule(
+        label="backreference",
+        description="Numbered backreference, can't be combined",
+        pattern=re.compile(r"^(\w+)-\1$"),
+    ),
+    Rule(
+        label="conditional",
+        description="Numbered conditional, can't be combined",
+        pattern=re.compile(r"^x(a)?(?(1)b|c)$"),
+    ),
+]
+
+RULE_MAP_IS_VALID_FIXTURES: list[RuleMapIsValidFixture] = [
+    RuleMapIsValidFixture("scp", "git@github.com:org/repo", None, True),
+    RuleMapIsValidFixture("scp-not-explicit", "git@github.com:org/repo", True, False),
+    RuleMapIsValidFixture("verbose", "gh:org/repo", None, True),
+    RuleMapIsValidFixture("verbose-explicit", "gh:org/repo", True, True),
+    RuleMapIsValidFixture("verbose-implicit", "gh:org/repo", False, False),
+    RuleMapIsValidFixture("backreference", "abc-abc", None, True),
+    RuleMapIsValidFixture("backreference-mismatch", "abc-abd", None, False),
+    RuleMapIsValidFixture("conditional", "xab", None, True),
+    RuleMapIsValidFixture("conditional-mismatch", "xb", None, False),
+    RuleMapIsValidFixture("no-match", "notaurl", None, False),
+    RuleMapIsValidFixture("not-at-start", "see gh:org/repo", None, False),
+]
+
+
+@pytest.mark.parametrize(
+    list(RuleMapIsValidFixture._fields),
+    RULE_MAP_IS_VALID_FIXTURES,
+    ids=[f.test_id for f in RULE_MAP_IS_VALID_FIXTURES],
+)
+def test_rule_map_is_valid(
+    test_id: str,
+    url: str,
+    is_explicit: t.Optional[bool],
+    expected: bool,
+) -> None:
+    """RuleMap.is_valid() agrees with checking each rule on its own."""
+    rule_map = RuleMap(_rule_map={rule.label: rule for rule in RULES})
+
+    assert rule_map.is_valid(url, is_explicit=is_explicit) is expected
+    assert expected is any(
+        rule.pattern.match(url)
+        for rule in RULES
+        if is_explicit is None or rule.is_explicit == is_explicit
+    )
+
+
+def test_rule_map_register_resets_cache() -> None:
+    """Registering and unregistering rules is reflected by RuleMap.is_valid()."""
+    rule_map = RuleMap(_rule_map={RULES[0].label: RULES[0]})
+
+    assert not rule_map.is_valid("gh:org/repo")
+
+    rule_map.register(RULES[1])
+    assert rule_map.is_valid("gh:org/repo")
+
+    rule_map.unregister(RULES[1].label)
+    assert not rule_map.is_valid("gh:org/repo")
+
+
+@pytest.mark.parametrize("copy_fn", [copy.copy, copy.deepcopy])
+def test_rule_map_copy(copy_fn: t.Callable[[RuleMap], RuleMap]) -> None:
+    """Copies of a rule map with warm caches don't share results once changed."""
+    rule_map = RuleMap(_rule_map={RULES[0].label: RULES[0]})
+    assert not rule_map.is_valid("gh:org/repo")
+    assert rule_map.match("gh:org/repo") is None
+
+    rule_map_copy = copy_fn(rule_map)
+    rule_map_copy.register(RULES[1])
+
+    assert rule_map_copy.is_valid("gh:org/repo")
+    assert rule_map_copy.match("gh:org/repo") is not None
+
+    assert not rule_map.is_valid("gh:org/repo")
+    assert rule_map.match("gh:org/repo") is None
+    assert list(rule_map) == [RULES[0].label]
+
+
+def test_rule_map_empty_default_not_shared() -> None:
+    """Registering on an empty RuleMap doesn't leak into other empty RuleMaps."""
+    rule_map = RuleMap()
+    other_rule_map = RuleMap()
+
+    rule_map.register(RULES[0])
+
+    assert list(rule_map) == [RULES[0].label]
+    assert list(other_rule_map) == []
+
+
+def test_rule_map_contains() -> None:
+    """``label in rule_map`` tracks register() and unregister()."""
+    rule_map = RuleMap(_rule_map={RULES[0].label: RULES[0]})
+
+    assert RULES[0].label in rule_map
+    assert RULES[1].label not in rule_map
+
+    rule_map.register(RULES[1])
+    assert RULES[1].label in rule_map
+
+    rule_map.unregister(RULES[1].label)
+    assert RULES[1].label not in rule_map
+
+
+def test_rule_map_by_weight() -> None:
+    """RuleMap.by_weight() orders by weight and picks up newly registered rules."""
+    rule_map = RuleMap(_rule_map={rule.label: rule for rule in RULES[::2]})
+
+    assert rule_map.by_weight() == (RULES[0], RULES[2])
+
+    rule_map.register(RULES[1])
+    assert rule_map.by_weight() == (RULES[1], RULES[0], RULES[2])
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [RULES[:2], RULES, [RULES[0], RULES[3]]],
+    ids=["combined", "fallback", "conditional"],
+)
+@pytest.mark.parametrize(
+    "url",
+    ["git@github.com:org/repo", "gh:org/repo", "abc-abc", "xab", "notaurl"],
+)
+def test_rule_map_match(rules: list[Rule], url: str) -> None:
+    """RuleMap.match() returns the first rule by weight and its groups."""
+    rule_map = RuleMap(_rule_map={rule.label: rule for rule in rules})
+
+    expected = next(
+        (
+            (rule, match.groupdict())
+            for rule in sorted(rules, key=lambda rule: rule.weight, reverse=True)
+            if (match := rule.pattern.match(url)) is not None
+        ),
+        None,
+    )
+    assert rule_map.match(url) == expected
+    assert rule_map.is_valid(url) is (expected is not None)
+
+
+def test_rule_map_compiles_str_patterns() -> None:
+    """Rules declared with a string pattern are compiled when the RuleMap is built."""
+    rule = Rule(label="gh", description="", pattern="^gh:(?P<path>.+)")  # type: ignore[arg-type]
+    rule_map = RuleMap(_rule_map={rule.label: rule})
+
+    assert all(isinstance(rule.pattern, re.Pattern) for rule in rule_map.values())
+
+
+def test_rule_map_shares_combined_pattern() -> None:
+    """Rule maps holding the same rules reuse one combined pattern."""
+    rule_map = RuleMap(_rule_map={rule.label: rule for rule in RULES[:2]})
+    other_rule_map = RuleMap(_rule_map={rule.label: rule for rule in RULES[:2]})
+
+    fused = rule_map._get_fused(is_explicit=None)
+    assert fused is not None
+    assert other_rule_map._get_fused(is_explicit=None) is fused
+
+    epoch = rule_map.epoch
+    rule_map.register(RULES[2])
+    rule_map.unregister(RULES[2].label)
+    assert rule_map.epoch == epoch + 2
+    assert rule_map._get_fused(is_explicit=None) is fused
+
+
+def test_rule_map_flat_rules() -> None:
+    """RuleMap._flat_rules() unpacks rules and picks up newly registered ones."""
+    rule_map = RuleMap(_rule_map={RULES[0].label: RULES[0]})
+
+    assert rule_map._flat_rules() == ((RULES[0].pattern, RULES[0].label, ()),)
+
+    rule_map.register(RULES[1])
+    assert [label for _, label, _ in rule_map._flat_rules()] == [
+        RULES[0].label,
+        RULES[1].label,
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        *git.DEFAULT_RULES,
+        *git.AWS_CODE_COMMIT_DEFAULT_RULES,
+        *git.PIP_DEFAULT_RULES,
+        *hg.DEFAULT_RULES,
+        *hg.PIP_DEFAULT_RULES,
+        *svn.DEFAULT_RULES,
+        *svn.PIP_DEFAULT_RULES,
+    ],
+    ids=lambda rule: rule.label,
+)
+def test_builtin_rules_anchored(rule: Rule) -> None:
+    """Built-in rules are compiled and only match from the start of URLs.
+
+    See libvcs.url.base.
+    """
+    assert isinstance(rule.pattern, re.Pattern)
+    assert rule.pattern.pattern.lstrip().startswith("^")
+
+
+def test_rule_map_match_concurrent_first_use() -> None:
+    """Threads using a fresh rule map at once all see its complete caches."""
+    rule_map = RuleMap(_rule_map={rule.label: rule for rule in git.DEFAULT_RULES})
+    barrier = threading.Barrier(8)
+    labels: list[t.Optional[str]] = []
+
+    def match() -> None:
+        barrier.wait()
+        matched = rule_map.match("https://github.com:443/org/repo")
+        labels.append(matched[0].label if matched else None)
+
+    threads = [threading.Thread(target=match) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert labels == ["core-git-https"] * 8
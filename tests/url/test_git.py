@@ -1,17 +1,22 @@
 """Tests for GitURL."""
 
+import gc
+import re
 import typing
+import weakref
 
 import pytest
 
 from libvcs.sync.git import GitSync
-from libvcs.url.base import RuleMap
+from libvcs.url.base import Rule, RuleMap
 from libvcs.url.git import (
     AWS_CODE_COMMIT_DEFAULT_RULES,
     DEFAULT_RULES,
     PIP_DEFAULT_RULES,
     GitBaseURL,
+    GitPipURL,
     GitURL,
+    _fast_match,
 )
 
 
@@ -374,3 +379,190 @@ def test_git_revs(
 
     git_url = GitURLWithPip(**git_url_kwargs)
     assert git_url.rev == expected
+
+
+FAST_MATCH_URLS = [
+    f"{prefix}{path}{suffix}"
+    for prefix in [
+        "https://github.com/",
+        "http://github.com/",
+        "https://github.com:443/",
+        "https://user@github.com/",
+        "git@github.com:",
+        "git@github.com/",
+        "ssh@github.com:",
+        "ssh://git@github.com/",
+        "a@b@github.com:",
+        "github.com:",
+        "git+https://github.com/",
+        "git+http://github.com/",
+        "git+https://git@github.com/",
+        "git+ssh://git@github.com:",
+    ]
+    for path in ["vcs-python/libvcs", "l", "", "-x", "a.b/c", "a@b"]
+    for suffix in ["", ".git", ".git/", "@v1.0", ".git@"]
+]
+
+
+@pytest.mark.parametrize("url_cls", [GitBaseURL, GitPipURL, GitURL])
+def test_git_url_fast_match(url_cls: type[GitBaseURL]) -> None:
+    """_fast_match() agrees with the rules, or leaves the URL to them."""
+    for url in FAST_MATCH_URLS:
+        fast_match = _fast_match(url_cls.rule_map, url)
+        if fast_match is None:
+            continue
+
+        rule, groups = fast_match
+        expected_rule, expected_groups = url_cls.rule_map.match(url) or (None, {})
+        assert rule is expected_rule, url
+        assert {k: v for k, v in groups.items() if v is not None} == {
+            k: v for k, v in expected_groups.items() if v is not None
+        }, url
+
+
+FAST_MATCH_CORE_URLS = [
+    "https://github.com/vcs-python/libvcs",
+    "https://github.com/vcs-python/libvcs.git",
+    "git@github.com:vcs-python/libvcs",
+    "git@github.com:vcs-python/libvcs.git",
+]
+
+FAST_MATCH_PIP_URLS = [
+    "git+https://github.com/vcs-python/libvcs",
+    "git+https://github.com/vcs-python/libvcs.git",
+    "git+https://github.com/vcs-python/libvcs.git@v1.0",
+]
+
+
+@pytest.mark.parametrize(
+    ("url_cls", "url"),
+    [
+        *((GitBaseURL, url) for url in FAST_MATCH_CORE_URLS),
+        *((GitURL, url) for url in [*FAST_MATCH_CORE_URLS, *FAST_MATCH_PIP_URLS]),
+        *((GitPipURL, url) for url in FAST_MATCH_PIP_URLS),
+    ],
+)
+def test_git_url_fast_match_common(url_cls: type[GitBaseURL], url: str) -> None:
+    """_fast_match() parses the most common URL shapes itself."""
+    fast_match = _fast_match(url_cls.rule_map, url)
+    assert fast_match is not None
+
+    rule, groups = fast_match
+    expected = url_cls.rule_map.match(url)
+    assert expected is not None
+    expected_rule, expected_groups = expected
+    assert rule is expected_rule
+    assert {k: v for k, v in groups.items() if v is not None} == {
+        k: v for k, v in expected_groups.items() if v is not None
+    }
+
+
+def test_git_url_parse_cached() -> None:
+    """GitURL.parse_cached() returns independent copies and sees rule changes."""
+
+    class GitURLWithPrefixes(GitBaseURL):
+        rule_map = RuleMap(_rule_map={m.label: m for m in DEFAULT_RULES})
+
+    url = "gitlab:vcs-python/libvcs"
+
+    git_url = GitURLWithPrefixes.parse_cached(url)
+    assert git_url == GitURLWithPrefixes(url)
+    assert git_url.rule == "core-git-scp"
+
+    git_url.path = "changed"
+    assert GitURLWithPrefixes.parse_cached(url).path == "vcs-python/libvcs"
+
+    GitURLWithPrefixes.rule_map.register(
+        Rule(
+            label="gl-prefix",
+            description="Matches prefixes like gitlab:org/repo",
+            pattern=re.compile(r"^gitlab:(?P<path>.*)$"),
+            defaults={"hostname": "gitlab.com", "scheme": "https"},
+            weight=100,
+        ),
+    )
+    assert GitURLWithPrefixes.parse_cached(url).rule == "gl-prefix"
+
+    GitURLWithPrefixes.rule_map.unregister("gl-prefix")
+    assert GitURLWithPrefixes.parse_cached(url).rule == "core-git-scp"
+
+
+def test_git_url_parse_cached_rule_map_replaced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """GitURL.parse_cached() follows a class's rule_map being replaced."""
+
+    class GitURLReplaceable(GitBaseURL):
+        rule_map = RuleMap(_rule_map={m.label: m for m in DEFAULT_RULES})
+
+    url = "git+https://github.com/org/repo.git"
+    assert GitURLReplaceable.parse_cached(url).rule is None
+
+    monkeypatch.setattr(
+        GitURLReplaceable,
+        "rule_map",
+        RuleMap(_rule_map={m.label: m for m in [*DEFAULT_RULES, *PIP_DEFAULT_RULES]}),
+    )
+    assert GitURLReplaceable.parse_cached(url).rule == "pip-url"
+    assert GitURLReplaceable.parse_cached(url) == GitURLReplaceable(url)
+
+
+def test_git_url_parse_cached_doesnt_keep_classes() -> None:
+    """Classes parsed with GitURL.parse_cached() can still be garbage collected."""
+
+    class GitURLThrowaway(GitBaseURL):
+        pass
+
+    GitURLThrowaway.parse_cached("git@github.com:vcs-python/libvcs.git")
+    class_ref = weakref.ref(GitURLThrowaway)
+    del GitURLThrowaway
+    gc.collect()
+
+    assert class_ref() is None
+
+
+@pytest.mark.parametrize("url_cls", [GitBaseURL, GitPipURL, GitURL])
+def test_git_url_parse_many(url_cls: type[GitBaseURL]) -> None:
+    """GitURL.parse_many() gives the same URLs as parsing each one."""
+    git_urls = url_cls.parse_many(iter(FAST_MATCH_URLS))
+
+    assert git_urls == [url_cls(url) for url in FAST_MATCH_URLS]
+    assert all(type(git_url) is url_cls for git_url in git_urls)
+
+
+def test_git_url_parse_many_post_init() -> None:
+    """GitURL.parse_many() runs an overridden __post_init__()."""
+
+    class GitURLLowerCase(GitBaseURL):
+        def __post_init__(self) -> None:
+            super().__post_init__()
+            if self.hostname is not None:
+                self.hostname = self.hostname.lower()
+
+    url = "git@GitHub.com:vcs-python/libvcs.git"
+
+    assert GitURLLowerCase.parse_many([url])[0].hostname == "github.com"
+
+
+def test_git_url_rules_not_combined() -> None:
+    """Rules that can't be combined into one pattern still parse."""
+
+    class GitURLWithBackreference(GitBaseURL):
+        rule_map = RuleMap(
+            _rule_map={
+                "mirror": Rule(
+                    label="mirror",
+                    description="Same name for org and repo, e.g. mirror:libvcs/libvcs",
+                    pattern=re.compile(r"^mirror:(?P<path>(\w+)/\2)$"),
+                    defaults={"hostname": "github.com", "scheme": "https"},
+                ),
+                **{m.label: m for m in DEFAULT_RULES},
+            },
+        )
+
+    git_url = GitURLWithBackreference("mirror:libvcs/libvcs")
+    assert git_url.rule == "mirror"
+    assert git_url.path == "libvcs/libvcs"
+    assert git_url.to_url() == "https://github.com/libvcs/libvcs"
+
+    assert GitURLWithBackreference("git@github.com:org/repo").rule == "core-git-scp"
@@ -5,7 +5,7 @@ import typing
 import pytest
 
 from libvcs.sync.hg import HgSync
-from libvcs.url.base import RuleMap
+from libvcs.url.base import Rule, RuleMap
 from libvcs.url.hg import DEFAULT_RULES, PIP_DEFAULT_RULES, HgBaseURL, HgURL
 
 
@@ -135,6 +135,25 @@ def test_hg_url_extension_pip(
     assert HgURLWithPip(url) == hg_url
 
 
+def test_hg_url_rule_string_pattern() -> None:
+    """HgURL parses with rule classes declaring their pattern as a string."""
+
+    class HgXPrefix(Rule):
+        label = "hgx-prefix"
+        description = "Matches prefixes like hgx:org/repo"
+        pattern = r"^hgx:(?P<path>.*)$"  # type: ignore[assignment]
+        defaults = {"scheme": "https"}  # noqa: RUF012
+
+    class HgURLWithPrefix(HgBaseURL):
+        rule_map = RuleMap(_rule_map={"hgx-prefix": HgXPrefix})  # type: ignore[dict-item]
+
+    hg_url = HgURLWithPrefix("hgx:vcs-python/libvcs")
+
+    assert hg_url.rule == "hgx-prefix"
+    assert hg_url.scheme == "https"
+    assert hg_url.path == "vcs-python/libvcs"
+
+
 class ToURLFixture(typing.NamedTuple):
     """Test fixture for HgURL.to_url()."""
 